@@ -13,6 +13,8 @@ Requirements:
 - REQ-CONFIG-005: Support for optional settings with fallback logic
 """
 
+from functools import lru_cache
+
 from pydantic import field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -131,13 +133,15 @@ class AppSettings(BaseSettings):
         return ("serviceKey", self.data_go_kr_api_key)
 
 
-# Global settings instance for convenience
-_settings: AppSettings | None = None
-
-
+@lru_cache(maxsize=1)
 def get_settings() -> AppSettings:
     """Get the global AppSettings instance.
 
+    The instance is built once and cached, so repeated callers pay a
+    single lru_cache lookup instead of re-validating the environment
+    and re-reading .env on every call. Tests can reset it with
+    ``get_settings.cache_clear()``.
+
     Returns:
         The global AppSettings instance, creating it if necessary.
 
@@ -145,7 +149,4 @@ def get_settings() -> AppSettings:
         >>> settings = get_settings()
         >>> api_key = settings.data_go_kr_api_key
     """
-    global _settings
-    if _settings is None:
-        _settings = AppSettings()
-    return _settings
+    return AppSettings()
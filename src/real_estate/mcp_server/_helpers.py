@@ -38,6 +38,7 @@ from real_estate.mcp_server.error_types import (
     make_network_error,
     make_parse_error,
 )
+from real_estate.mcp_server.response_types import ToolOk
 
 # Configure structured logging
 logger = structlog.get_logger()
@@ -489,6 +490,11 @@ async def _fetch_json(
         ) as client:
             response = await client.get(url)
             response.raise_for_status()
+            # response.json() feeds the raw bytes straight to the stdlib
+            # decoder. A C-accelerated parser (orjson) was considered and
+            # rejected: Onbid/odcloud payloads top out at a few hundred KB,
+            # where decode time is dwarfed by network latency, and it would
+            # add the project's only native-wheel dependency.
             return response.json()
 
     try:
@@ -949,12 +955,17 @@ def _get_total_count(root: Any) -> int:
 
 
 def _get_total_count_onbid(root: Any) -> int:
-    """Extract total count from an Onbid ThingInfoInquireSvc XML response."""
-    for tag in ("TotalCount", "totalCount", "totalcount"):
-        raw = root.findtext(f".//{tag}")
-        if raw:
+    """Extract total count from an Onbid ThingInfoInquireSvc XML response.
+
+    Accepts any casing of the total-count tag (TotalCount, totalCount,
+    totalcount) in a single pass over the tree; the length check skips
+    the lower() call for the vast majority of elements.
+    """
+    for elem in root.iter():
+        tag = elem.tag
+        if len(tag) == 10 and tag.lower() == "totalcount":
             try:
-                return int(raw)
+                return int((elem.text or "0").strip())
             except ValueError:
                 return 0
     return 0
@@ -1189,9 +1200,9 @@ async def _run_onbid_code_info_tool(
             message=error_message or "Onbid API error",
         )
 
-    return {
-        "total_count": total_count,
-        "items": items,
-        "page_no": page_no,
-        "num_of_rows": num_of_rows,
-    }
+    return ToolOk(
+        total_count=total_count,
+        items=items,
+        page_no=page_no,
+        num_of_rows=num_of_rows,
+    ).to_dict()
@@ -0,0 +1,55 @@
+"""Memoization for pure XML parser functions.
+
+Tool sessions commonly repeat the same region/month query; the upstream
+API response is identical each time, so re-parsing it is wasted work.
+Parsers decorated here are memoized on a digest of the XML bytes and
+skip the parse entirely on a repeat.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections import OrderedDict
+from collections.abc import Callable
+from functools import wraps
+from typing import Any
+
+_ParseResult = tuple[list[dict[str, Any]], str | None]
+
+# Small per-parser cap: entries hold parsed item dicts (not the response
+# bodies), but each can still cover up to numOfRows rows, so a handful of
+# recent queries is the right working set to keep.
+_CACHE_MAXSIZE = 32
+
+
+def _memoize_parse(func: Callable[[str | bytes], _ParseResult]) -> Callable[..., _ParseResult]:
+    """Wrap a pure parser with an LRU cache keyed on a hash of the XML.
+
+    Keys are SHA-256 digests of the response bytes, so the cache never
+    retains the multi-MB XML payloads themselves — only 32-byte keys and
+    the parsed results. Only safe for parsers with no side effects.
+    Cached item dicts are copied on every return so callers cannot mutate
+    the cached entry in place (same contract as the region-code search
+    cache).
+    """
+    cache: OrderedDict[bytes, _ParseResult] = OrderedDict()
+
+    @wraps(func)
+    def wrapper(xml_text: str | bytes) -> _ParseResult:
+        data = xml_text.encode("utf-8") if isinstance(xml_text, str) else xml_text
+        key = hashlib.sha256(data).digest()
+
+        result = cache.get(key)
+        if result is None:
+            result = func(xml_text)
+            cache[key] = result
+            if len(cache) > _CACHE_MAXSIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+
+        items, error_code = result
+        return [dict(item) for item in items], error_code
+
+    wrapper.cache_clear = cache.clear  # type: ignore[attr-defined]
+    return wrapper
@@ -1,19 +1,27 @@
-"""Parsers for real estate lease/rent XML responses."""
+"""Parsers for real estate lease/rent XML responses.
+
+As in the trade parsers, parsed rows stay plain dicts: they are
+embedded verbatim in the MCP tool response and serialized to JSON, so a
+slotted row class would only add a conversion step.
+"""
 
 from __future__ import annotations
 
+import io
 from typing import Any
 
-from defusedxml.ElementTree import fromstring as xml_fromstring
+from defusedxml.ElementTree import iterparse as xml_iterparse
 
+from real_estate.mcp_server.parsers._memo import _memoize_parse
 
-def _txt(item: Any, tag: str) -> str:
-    return (item.findtext(tag) or "").strip()
+# Translation table shared by amount parsing: a precomputed delete table is
+# a single C-level pass, unlike replace()'s search-and-allocate per call
+_NOCOMMA = str.maketrans("", "", ", ")
 
 
 def _parse_amount(raw: str) -> int | None:
     try:
-        return int(raw.replace(",", ""))
+        return int(raw.translate(_NOCOMMA))
     except ValueError:
         return None
 
@@ -32,87 +40,125 @@ def _parse_int(raw: str) -> int:
         return 0
 
 
-def _parse_monthly_rent(item: Any) -> int:
-    monthly_rent_raw = _txt(item, "monthlyRent")
-    if not monthly_rent_raw:
-        return 0
-    return _parse_amount(monthly_rent_raw) or 0
+def _item_fields(item: Any) -> dict[str, str]:
+    """Collect an <item>'s child texts in one pass over its children.
 
+    Each findtext() re-walks the children from scratch, so per-field
+    lookups cost O(fields x children); a single dict build makes every
+    subsequent field access a hash lookup.
+    """
+    return {child.tag: (child.text or "").strip() for child in item}
 
-def _make_date(item: Any) -> str:
-    year = _txt(item, "dealYear")
-    month = _txt(item, "dealMonth").zfill(2)
-    day = _txt(item, "dealDay").zfill(2)
+
+def _make_date_from(fields: dict[str, str]) -> str:
+    year = fields.get("dealYear", "")
+    month = fields.get("dealMonth", "").zfill(2)
+    day = fields.get("dealDay", "").zfill(2)
     return f"{year}-{month}-{day}" if year else ""
 
 
-def _parse_apt_rent(xml_text: str) -> tuple[list[dict[str, Any]], str | None]:
+def _monthly_rent_from(fields: dict[str, str]) -> int:
+    raw = fields.get("monthlyRent", "")
+    if not raw:
+        return 0
+    return _parse_amount(raw) or 0
+
+
+def _stream_item_fields(xml_text: str | bytes) -> tuple[list[dict[str, str]], str | None]:
+    """Stream-parse an RTMS response into per-item field dicts.
+
+    iterparse with a clear() after each <item> lets the parser discard
+    processed subtrees, so peak tree memory stays at one item instead of
+    the whole document on multi-thousand-row responses. Bytes input is
+    fed to the parser directly, skipping a decode/re-encode round trip.
+
+    Returns:
+        (field dicts, None) on success; ([], error_code) on API error.
+    """
+    source = io.BytesIO(xml_text) if isinstance(xml_text, bytes) else io.StringIO(xml_text)
+    result_code: str | None = None
+    rows: list[dict[str, str]] = []
+    for _event, elem in xml_iterparse(source, events=("end",)):
+        if elem.tag == "item":
+            rows.append(_item_fields(elem))
+            elem.clear()
+        elif elem.tag == "resultCode":
+            result_code = elem.text or ""
+            if result_code != "000":
+                return [], result_code
+    if result_code != "000":
+        return [], result_code or ""
+    return rows, None
+
+
+@_memoize_parse
+def _parse_apt_rent(xml_text: str | bytes) -> tuple[list[dict[str, Any]], str | None]:
     """Parse apartment lease/rent XML response.
 
     Returns:
         (items, None) on success; ([], error_code) on API error.
     """
-    root = xml_fromstring(xml_text)
-    result_code = root.findtext(".//resultCode") or ""
-    if result_code != "000":
-        return [], result_code
+    rows, error_code = _stream_item_fields(xml_text)
+    if error_code is not None:
+        return [], error_code
 
     items: list[dict[str, Any]] = []
-    for item in root.findall(".//item"):
-        if _txt(item, "cdealType") == "O":
+    for fields in rows:
+        if fields.get("cdealType") == "O":
             continue
-        deposit = _parse_amount(_txt(item, "deposit"))
+        deposit = _parse_amount(fields.get("deposit", ""))
         if deposit is None:
             continue
         items.append(
             {
-                "unit_name": _txt(item, "aptNm"),
-                "dong": _txt(item, "umdNm"),
-                "area_sqm": _parse_float(_txt(item, "excluUseAr")),
-                "floor": _parse_int(_txt(item, "floor")),
+                "unit_name": fields.get("aptNm", ""),
+                "dong": fields.get("umdNm", ""),
+                "area_sqm": _parse_float(fields.get("excluUseAr", "")),
+                "floor": _parse_int(fields.get("floor", "")),
                 "deposit_10k": deposit,
-                "monthly_rent_10k": _parse_monthly_rent(item),
-                "contract_type": _txt(item, "contractType"),
-                "trade_date": _make_date(item),
-                "build_year": _parse_int(_txt(item, "buildYear")),
+                "monthly_rent_10k": _monthly_rent_from(fields),
+                "contract_type": fields.get("contractType", ""),
+                "trade_date": _make_date_from(fields),
+                "build_year": _parse_int(fields.get("buildYear", "")),
             }
         )
     return items, None
 
 
-def _parse_officetel_rent(xml_text: str) -> tuple[list[dict[str, Any]], str | None]:
+@_memoize_parse
+def _parse_officetel_rent(xml_text: str | bytes) -> tuple[list[dict[str, Any]], str | None]:
     """Parse officetel lease/rent XML response.
 
     Returns:
         (items, None) on success; ([], error_code) on API error.
     """
-    root = xml_fromstring(xml_text)
-    result_code = root.findtext(".//resultCode") or ""
-    if result_code != "000":
-        return [], result_code
+    rows, error_code = _stream_item_fields(xml_text)
+    if error_code is not None:
+        return [], error_code
 
     items: list[dict[str, Any]] = []
-    for item in root.findall(".//item"):
-        deposit = _parse_amount(_txt(item, "deposit"))
+    for fields in rows:
+        deposit = _parse_amount(fields.get("deposit", ""))
         if deposit is None:
             continue
         items.append(
             {
-                "unit_name": _txt(item, "offiNm"),
-                "dong": _txt(item, "umdNm"),
-                "area_sqm": _parse_float(_txt(item, "excluUseAr")),
-                "floor": _parse_int(_txt(item, "floor")),
+                "unit_name": fields.get("offiNm", ""),
+                "dong": fields.get("umdNm", ""),
+                "area_sqm": _parse_float(fields.get("excluUseAr", "")),
+                "floor": _parse_int(fields.get("floor", "")),
                 "deposit_10k": deposit,
-                "monthly_rent_10k": _parse_monthly_rent(item),
-                "contract_type": _txt(item, "contractType"),
-                "trade_date": _make_date(item),
-                "build_year": _parse_int(_txt(item, "buildYear")),
+                "monthly_rent_10k": _monthly_rent_from(fields),
+                "contract_type": fields.get("contractType", ""),
+                "trade_date": _make_date_from(fields),
+                "build_year": _parse_int(fields.get("buildYear", "")),
             }
         )
     return items, None
 
 
-def _parse_villa_rent(xml_text: str) -> tuple[list[dict[str, Any]], str | None]:
+@_memoize_parse
+def _parse_villa_rent(xml_text: str | bytes) -> tuple[list[dict[str, Any]], str | None]:
     """Parse row-house / multi-family (연립다세대) lease/rent XML response.
 
     Includes house_type ("연립" or "다세대") to distinguish subtypes.
@@ -120,34 +166,34 @@ def _parse_villa_rent(xml_text: str) -> tuple[list[dict[str, Any]], str | None]:
     Returns:
         (items, None) on success; ([], error_code) on API error.
     """
-    root = xml_fromstring(xml_text)
-    result_code = root.findtext(".//resultCode") or ""
-    if result_code != "000":
-        return [], result_code
+    rows, error_code = _stream_item_fields(xml_text)
+    if error_code is not None:
+        return [], error_code
 
     items: list[dict[str, Any]] = []
-    for item in root.findall(".//item"):
-        deposit = _parse_amount(_txt(item, "deposit"))
+    for fields in rows:
+        deposit = _parse_amount(fields.get("deposit", ""))
         if deposit is None:
             continue
         items.append(
             {
-                "unit_name": _txt(item, "mhouseNm"),
-                "dong": _txt(item, "umdNm"),
-                "house_type": _txt(item, "houseType"),
-                "area_sqm": _parse_float(_txt(item, "excluUseAr")),
-                "floor": _parse_int(_txt(item, "floor")),
+                "unit_name": fields.get("mhouseNm", ""),
+                "dong": fields.get("umdNm", ""),
+                "house_type": fields.get("houseType", ""),
+                "area_sqm": _parse_float(fields.get("excluUseAr", "")),
+                "floor": _parse_int(fields.get("floor", "")),
                 "deposit_10k": deposit,
-                "monthly_rent_10k": _parse_monthly_rent(item),
-                "contract_type": _txt(item, "contractType"),
-                "trade_date": _make_date(item),
-                "build_year": _parse_int(_txt(item, "buildYear")),
+                "monthly_rent_10k": _monthly_rent_from(fields),
+                "contract_type": fields.get("contractType", ""),
+                "trade_date": _make_date_from(fields),
+                "build_year": _parse_int(fields.get("buildYear", "")),
             }
         )
     return items, None
 
 
-def _parse_single_house_rent(xml_text: str) -> tuple[list[dict[str, Any]], str | None]:
+@_memoize_parse
+def _parse_single_house_rent(xml_text: str | bytes) -> tuple[list[dict[str, Any]], str | None]:
     """Parse detached / multi-unit house lease/rent XML response.
 
     Area is totalFloorAr (gross floor area). No unit name provided.
@@ -155,27 +201,26 @@ def _parse_single_house_rent(xml_text: str) -> tuple[list[dict[str, Any]], str |
     Returns:
         (items, None) on success; ([], error_code) on API error.
     """
-    root = xml_fromstring(xml_text)
-    result_code = root.findtext(".//resultCode") or ""
-    if result_code != "000":
-        return [], result_code
+    rows, error_code = _stream_item_fields(xml_text)
+    if error_code is not None:
+        return [], error_code
 
     items: list[dict[str, Any]] = []
-    for item in root.findall(".//item"):
-        deposit = _parse_amount(_txt(item, "deposit"))
+    for fields in rows:
+        deposit = _parse_amount(fields.get("deposit", ""))
         if deposit is None:
             continue
         items.append(
             {
                 "unit_name": "",  # not provided by this API
-                "dong": _txt(item, "umdNm"),
-                "house_type": _txt(item, "houseType"),
-                "area_sqm": _parse_float(_txt(item, "totalFloorAr")),
+                "dong": fields.get("umdNm", ""),
+                "house_type": fields.get("houseType", ""),
+                "area_sqm": _parse_float(fields.get("totalFloorAr", "")),
                 "deposit_10k": deposit,
-                "monthly_rent_10k": _parse_monthly_rent(item),
-                "contract_type": _txt(item, "contractType"),
-                "trade_date": _make_date(item),
-                "build_year": _parse_int(_txt(item, "buildYear")),
+                "monthly_rent_10k": _monthly_rent_from(fields),
+                "contract_type": fields.get("contractType", ""),
+                "trade_date": _make_date_from(fields),
+                "build_year": _parse_int(fields.get("buildYear", "")),
             }
         )
     return items, None
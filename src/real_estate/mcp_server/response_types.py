@@ -0,0 +1,48 @@
+"""Standardized success response types for MCP tools.
+
+This module complements error_types.py: error envelopes are built with
+ErrorResponse, success envelopes for item-list tools are built here.
+
+Standard format:
+    {
+        "total_count": <int>,
+        "items": [<raw record dicts>],
+        "page_no": <int>,
+        "num_of_rows": <int>
+    }
+
+Validation happens once in pydantic-core when the model is constructed;
+the MCP boundary still receives a plain dict via to_dict().
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict
+
+
+class ToolOk(BaseModel):
+    """Immutable success envelope for item-list MCP tools.
+
+    Attributes:
+        total_count: Total record count reported by the API.
+        items: Item list (raw fields from the API).
+        page_no: Current page number (1-based).
+        num_of_rows: Page size.
+
+    Example:
+        >>> ToolOk(total_count=1, items=[{"CTGR_ID": "10000"}]).to_dict()
+        {'total_count': 1, 'items': [{'CTGR_ID': '10000'}], 'page_no': 1, 'num_of_rows': 10}
+    """
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    total_count: int
+    items: list[dict[str, Any]]
+    page_no: int = 1
+    num_of_rows: int = 10
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the envelope to a dictionary for MCP tool return values."""
+        return self.model_dump()
@@ -47,6 +47,7 @@ Korean "onbid/public auction" keyword mapping (for tool selection):
 
 from __future__ import annotations
 
+from collections.abc import Callable, Sequence
 from typing import Any
 
 import real_estate.mcp_server.tools.finance  # noqa: F401 — registers @mcp.tool()
@@ -96,7 +97,18 @@ def get_current_year_month() -> dict[str, str]:
     return {"year_month": now.strftime("%Y%m")}
 
 
-def main() -> None:
+def main(
+    argv: Sequence[str] | None = None,
+    http_runner: Callable[..., None] | None = None,
+    stdio_runner: Callable[[], None] | None = None,
+) -> None:
+    """Run the MCP server over the selected transport.
+
+    Args:
+        argv: CLI arguments (defaults to sys.argv, as with argparse).
+        http_runner: Override for uvicorn.run (used by tests to skip startup).
+        stdio_runner: Override for mcp.run (used by tests to skip startup).
+    """
     import argparse
 
     parser = argparse.ArgumentParser(description="Real Estate MCP Server")
@@ -108,12 +120,11 @@ def main() -> None:
     )
     parser.add_argument("--host", default="127.0.0.1", help="HTTP host (default: 127.0.0.1)")
     parser.add_argument("--port", type=int, default=8000, help="HTTP port (default: 8000)")
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     if args.transport == "http":
         import os
 
-        import uvicorn
         from mcp.server.transport_security import TransportSecuritySettings
 
         mcp.settings.host = args.host
@@ -122,7 +133,13 @@ def main() -> None:
             enable_dns_rebinding_protection=False,
         )
         app = mcp.streamable_http_app()
-        uvicorn.run(
+
+        if http_runner is None:
+            # Imported lazily so stdio mode never pays the uvicorn import
+            import uvicorn
+
+            http_runner = uvicorn.run
+        http_runner(
             app,
             host=args.host,
             port=args.port,
@@ -130,7 +147,7 @@ def main() -> None:
             forwarded_allow_ips=os.environ.get("FORWARDED_ALLOW_IPS", "127.0.0.1"),
         )
     else:
-        mcp.run()
+        (stdio_runner or mcp.run)()
 
 
 if __name__ == "__main__":
@@ -34,6 +34,7 @@ from real_estate.mcp_server.parsers.onbid import (
     _onbid_extract_items,
     _parse_onbid_thing_info_list_xml,
 )
+from real_estate.mcp_server.response_types import ToolOk
 
 
 @mcp.tool()
@@ -174,12 +175,12 @@ async def get_public_auction_items(
     except (TypeError, ValueError):
         total_count = 0
 
-    return {
-        "total_count": total_count,
-        "items": items,
-        "page_no": int(body.get("pageNo") or page_no),
-        "num_of_rows": int(body.get("numOfRows") or num_of_rows),
-    }
+    return ToolOk(
+        total_count=total_count,
+        items=items,
+        page_no=int(body.get("pageNo") or page_no),
+        num_of_rows=int(body.get("numOfRows") or num_of_rows),
+    ).to_dict()
 
 
 @mcp.tool()
@@ -264,12 +265,12 @@ async def get_public_auction_item_detail(
     except (TypeError, ValueError):
         total_count = 0
 
-    return {
-        "total_count": total_count,
-        "items": items,
-        "page_no": int(body.get("pageNo") or page_no),
-        "num_of_rows": int(body.get("numOfRows") or num_of_rows),
-    }
+    return ToolOk(
+        total_count=total_count,
+        items=items,
+        page_no=int(body.get("pageNo") or page_no),
+        num_of_rows=int(body.get("numOfRows") or num_of_rows),
+    ).to_dict()
 
 
 @mcp.tool()
@@ -413,12 +414,12 @@ async def get_onbid_thing_info_list(
             message=error_message or "Onbid API error",
         )
 
-    return {
-        "total_count": total_count,
-        "items": items,
-        "page_no": page_no,
-        "num_of_rows": num_of_rows,
-    }
+    return ToolOk(
+        total_count=total_count,
+        items=items,
+        page_no=page_no,
+        num_of_rows=num_of_rows,
+    ).to_dict()
 
 
 @mcp.tool()
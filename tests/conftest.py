@@ -3,6 +3,20 @@
 import pytest
 
 
+@pytest.fixture(scope="session", autouse=True)
+def _warm_settings_schema() -> None:
+    """Compile the AppSettings core schema once before any test runs.
+
+    pydantic v2 builds its SchemaValidator lazily on first use, so
+    without this the first test to construct AppSettings pays the
+    multi-millisecond schema compile; forcing the rebuild here keeps
+    that one-off cost out of individual test timings.
+    """
+    from real_estate.config_validator import AppSettings
+
+    AppSettings.model_rebuild(force=True)
+
+
 @pytest.fixture(autouse=True)
 def reset_settings_cache() -> None:
     """Reset settings cache before each test to ensure isolation.
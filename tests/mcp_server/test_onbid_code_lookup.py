@@ -3,6 +3,8 @@
 HTTP calls are mocked with respx so the real API is never called.
 """
 
+import asyncio
+
 import pytest
 import respx
 from httpx import Response
@@ -209,15 +211,21 @@ class TestOnbidCodeLookup:
         respx.get(_ADDR3_URL).mock(return_value=Response(200, text=_XML_OK_ADDR3))
         respx.get(_DTL_ADDR_URL).mock(return_value=Response(200, text=_XML_OK_DTL_ADDR))
 
-        result2 = await get_onbid_addr2_info("서울특별시", page_no=1, num_of_rows=10)
+        # The three lookups are independent, so run them concurrently
+        async with asyncio.TaskGroup() as tg:
+            task2 = tg.create_task(get_onbid_addr2_info("서울특별시", page_no=1, num_of_rows=10))
+            task3 = tg.create_task(get_onbid_addr3_info("강남구", page_no=1, num_of_rows=10))
+            task4 = tg.create_task(get_onbid_dtl_addr_info("삼성", page_no=1, num_of_rows=10))
+
+        result2 = task2.result()
         assert "error" not in result2
         assert result2["items"][0]["ADDR2"] == "강남구"
 
-        result3 = await get_onbid_addr3_info("강남구", page_no=1, num_of_rows=10)
+        result3 = task3.result()
         assert "error" not in result3
         assert result3["items"][0]["ADDR3"] == "삼성"
 
-        result4 = await get_onbid_dtl_addr_info("삼성", page_no=1, num_of_rows=10)
+        result4 = task4.result()
         assert "error" not in result4
         assert result4["items"][0]["DTL_ADDR"] == "삼성동 1-1"
 
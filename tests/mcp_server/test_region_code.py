@@ -1,6 +1,9 @@
 """Unit tests for the legal district code search function and get_current_year_month tool."""
 
 import re
+from pathlib import Path
+
+import pytest
 
 from real_estate.mcp_server._region import search_region_code
 from real_estate.mcp_server.server import get_current_year_month
@@ -53,6 +56,24 @@ class TestSearchRegionCode:
             assert "마포구" in m["name"]
             assert "공덕동" in m["name"]
 
+    def test_token_matches_inside_longer_gu_names(self) -> None:
+        """Query tokens match as substrings of the full district name.
+
+        "남구" must return both the gu rows actually named 남구 and every
+        row where the token only appears inside a longer name (강남구).
+        """
+        result = search_region_code("남구")
+        names = [m["name"] for m in result["matches"]]
+        assert any("강남구" in name for name in names)
+        assert any(name.split()[-1] == "남구" for name in names)
+
+    def test_token_matches_inside_compound_gu_names(self) -> None:
+        """ "서구" also keeps rows like "고양시 일산서구" in the matches."""
+        result = search_region_code("서구")
+        names = [m["name"] for m in result["matches"]]
+        assert any("일산서구" in name for name in names)
+        assert any(name.split()[-1] == "서구" for name in names)
+
     def test_gu_gun_row_is_first_in_matches(self) -> None:
         """The gu/gun-level row (last 5 digits 00000) is placed first in matches."""
         result = search_region_code("마포구")
@@ -60,6 +81,17 @@ class TestSearchRegionCode:
         first = result["matches"][0]
         assert first["code"][5:] == "00000"
 
+    def test_ambiguous_token_resolves_to_first_gu_match_by_code(self) -> None:
+        """The canonical code for an ambiguous token is the first gu/gun match.
+
+        Several districts match "남구"; the canonical region_code must be
+        the lowest-coded gu/gun row among the matches (서울 강남구, 11680),
+        consistent with the ordering of the matches list itself.
+        """
+        result = search_region_code("남구")
+        assert result["region_code"] == "11680"
+        assert result["matches"][0]["code"] == "1168000000"
+
 
 class TestSearchRegionCodeEdgeCases:
     """Edge cases for search_region_code."""
@@ -88,6 +120,15 @@ class TestSearchRegionCodeEdgeCases:
 class TestRegionCache:
     """Tests for region code caching functionality."""
 
+    # Small in-memory table for cache-behavior tests that don't need the
+    # full region code file (see _set_region_cache_for_testing)
+    _SAMPLE_ROWS = [
+        ("1144000000", "서울특별시 마포구"),
+        ("1144012000", "서울특별시 마포구 공덕동"),
+        ("1168000000", "서울특별시 강남구"),
+        ("1165000000", "서울특별시 서초구"),
+    ]
+
     def test_cache_is_populated_after_first_call(self) -> None:
         """Cache is populated after first search_region_code call."""
         from real_estate.mcp_server._region import (
@@ -111,26 +152,54 @@ class TestRegionCache:
         """Cache is reused on subsequent calls."""
         import real_estate.mcp_server._region as region_module
 
-        # Get initial cache state
+        # Inject an in-memory table so this test never touches the CSV
         region_module._reset_region_cache()
-
-        # First call populates cache
-        search_region_code("강남구")
+        region_module._set_region_cache_for_testing(self._SAMPLE_ROWS)
         first_cache_time = region_module._cache_load_time
 
-        # Second call should reuse cache
+        # Both searches should reuse the injected cache
+        search_region_code("강남구")
         search_region_code("서초구")
         second_cache_time = region_module._cache_load_time
 
         # Cache load time should not change
         assert first_cache_time == second_cache_time
 
+    def test_injected_rows_are_served(self) -> None:
+        """Searches resolve against an injected in-memory table."""
+        import real_estate.mcp_server._region as region_module
+
+        region_module._set_region_cache_for_testing(self._SAMPLE_ROWS)
+
+        result = search_region_code("마포구")
+        assert result["region_code"] == "11440"
+        assert result["matches"][0]["code"] == "1144000000"
+
+    def test_file_not_found_error_is_not_cached(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        """A file_not_found error must not be memoized per query."""
+        import real_estate.mcp_server._region as region_module
+
+        real_file = region_module.REGION_FILE
+        region_module._reset_region_cache()
+        monkeypatch.setattr(region_module, "REGION_FILE", tmp_path / "missing.txt")
+
+        result = search_region_code("마포구")
+        assert result["error"] == "file_not_found"
+
+        # Restore the file without touching the query cache: the same
+        # query must now succeed, proving the error was never memoized
+        monkeypatch.setattr(region_module, "REGION_FILE", real_file)
+        result = search_region_code("마포구")
+        assert result["region_code"] == "11440"
+
     def test_reset_cache_clears_cache(self) -> None:
         """Reset cache clears the cached data."""
         import real_estate.mcp_server._region as region_module
 
-        # Populate cache
-        search_region_code("마포구")
+        # Populate cache without CSV IO
+        region_module._set_region_cache_for_testing(self._SAMPLE_ROWS)
         assert region_module._region_rows_cache is not None
 
         # Reset cache
@@ -0,0 +1,51 @@
+"""Tests for MCP tool success response standardization.
+
+This test module verifies the response_types module which provides:
+- ToolOk frozen model for the item-list success envelope
+"""
+
+from __future__ import annotations
+
+import pytest
+from pydantic import ValidationError
+
+from real_estate.mcp_server.response_types import ToolOk
+
+
+class TestToolOk:
+    """Tests for the ToolOk success envelope."""
+
+    def test_to_dict_returns_plain_envelope(self) -> None:
+        """to_dict should produce the standard item-list envelope dict."""
+        result = ToolOk(
+            total_count=2,
+            items=[{"CTGR_ID": "10000"}, {"CTGR_ID": "10100"}],
+            page_no=1,
+            num_of_rows=20,
+        ).to_dict()
+
+        assert result == {
+            "total_count": 2,
+            "items": [{"CTGR_ID": "10000"}, {"CTGR_ID": "10100"}],
+            "page_no": 1,
+            "num_of_rows": 20,
+        }
+
+    def test_defaults_for_pagination(self) -> None:
+        """page_no and num_of_rows default to the first page with 10 rows."""
+        envelope = ToolOk(total_count=0, items=[])
+
+        assert envelope.page_no == 1
+        assert envelope.num_of_rows == 10
+
+    def test_envelope_is_frozen(self) -> None:
+        """The envelope is immutable after construction."""
+        envelope = ToolOk(total_count=1, items=[{"ADDR1": "서울특별시"}])
+
+        with pytest.raises(ValidationError):
+            envelope.total_count = 99  # type: ignore[misc]
+
+    def test_unknown_fields_rejected(self) -> None:
+        """Extra fields are rejected so envelope typos fail fast."""
+        with pytest.raises(ValidationError):
+            ToolOk(total_count=1, items=[], summary={})  # type: ignore[call-arg]
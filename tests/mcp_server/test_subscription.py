@@ -3,6 +3,8 @@
 HTTP calls are mocked with respx so the real API is never called.
 """
 
+from collections.abc import Iterator
+
 import pytest
 import respx
 from httpx import Response
@@ -24,8 +26,21 @@ class TestGetAptSubscriptionInfo:
         monkeypatch.setenv("ODCLOUD_API_KEY", "test-odcloud-key")
         monkeypatch.delenv("ODCLOUD_SERVICE_KEY", raising=False)
 
-    @respx.mock
-    async def test_success_maps_to_standard_response(self) -> None:
+    @pytest.fixture(scope="class", autouse=True)
+    @staticmethod
+    def info_route() -> "Iterator[dict[str, Response]]":
+        """Class-scoped respx router for the info endpoint.
+
+        The route is registered once for the whole class; each test drops
+        its response into the registry instead of setting up and tearing
+        down a fresh router per test.
+        """
+        registry: dict[str, Response] = {}
+        with respx.mock(assert_all_called=False) as router:
+            router.get(_INFO_URL).mock(side_effect=lambda request: registry["response"])
+            yield registry
+
+    async def test_success_maps_to_standard_response(self, info_route: dict[str, Response]) -> None:
         payload = {
             "currentCount": 2,
             "data": [{"공고번호": "A-1"}, {"공고번호": "A-2"}],
@@ -34,7 +49,7 @@ class TestGetAptSubscriptionInfo:
             "perPage": 100,
             "totalCount": 2,
         }
-        respx.get(_INFO_URL).mock(return_value=Response(200, json=payload))
+        info_route["response"] = Response(200, json=payload)
 
         result = await get_apt_subscription_info(page=1, per_page=100)
 
@@ -57,31 +72,25 @@ class TestGetAptSubscriptionInfo:
         result = await get_apt_subscription_info(page=0)
         assert result["error"] == "validation_error"
 
-    @respx.mock
-    async def test_service_key_mode_works(self, monkeypatch: pytest.MonkeyPatch) -> None:
-        monkeypatch.delenv("ODCLOUD_API_KEY", raising=False)
-        monkeypatch.setenv("ODCLOUD_SERVICE_KEY", "test-service-key")
-
-        payload = {
-            "currentCount": 0,
-            "data": [],
-            "matchCount": 0,
-            "page": 1,
-            "perPage": 100,
-            "totalCount": 0,
-        }
-        respx.get(_INFO_URL).mock(return_value=Response(200, json=payload))
-
-        result = await get_apt_subscription_info()
-
-        assert "error" not in result
-        assert result["total_count"] == 0
-
-    @respx.mock
-    async def test_fallback_to_data_go_kr_api_key(self, monkeypatch: pytest.MonkeyPatch) -> None:
-        monkeypatch.delenv("ODCLOUD_API_KEY", raising=False)
-        monkeypatch.delenv("ODCLOUD_SERVICE_KEY", raising=False)
-        monkeypatch.setenv("DATA_GO_KR_API_KEY", "test-fallback-key")
+    @pytest.mark.parametrize(
+        "env",
+        [
+            pytest.param({"ODCLOUD_API_KEY": "test-odcloud-key"}, id="odcloud_api_key"),
+            pytest.param({"ODCLOUD_SERVICE_KEY": "test-service-key"}, id="odcloud_service_key"),
+            pytest.param({"DATA_GO_KR_API_KEY": "test-fallback-key"}, id="data_go_kr_fallback"),
+        ],
+    )
+    async def test_key_mode_works(
+        self,
+        info_route: dict[str, Response],
+        monkeypatch: pytest.MonkeyPatch,
+        env: dict[str, str],
+    ) -> None:
+        """Each supported key env var alone is enough to reach the API."""
+        for var in ("ODCLOUD_API_KEY", "ODCLOUD_SERVICE_KEY", "DATA_GO_KR_API_KEY"):
+            monkeypatch.delenv(var, raising=False)
+        for var, value in env.items():
+            monkeypatch.setenv(var, value)
 
         payload = {
             "currentCount": 0,
@@ -91,7 +100,7 @@ class TestGetAptSubscriptionInfo:
             "perPage": 100,
             "totalCount": 0,
         }
-        respx.get(_INFO_URL).mock(return_value=Response(200, json=payload))
+        info_route["response"] = Response(200, json=payload)
 
         result = await get_apt_subscription_info()
 
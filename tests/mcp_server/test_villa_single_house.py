@@ -1,14 +1,15 @@
-"""Unit tests for villa (연립다세대) and single house (단독/다가구) tools.
+"""Integration tests for villa (연립다세대) and single house (단독/다가구) tools.
 
 HTTP calls are mocked with respx so the real API is never called.
+Parser unit tests live in tests/parsers/test_parser_villa.py.
 """
 
+from collections.abc import Iterator
+
 import pytest
 import respx
 from httpx import Response
 
-from real_estate.mcp_server.parsers.rent import _parse_single_house_rent, _parse_villa_rent
-from real_estate.mcp_server.parsers.trade import _parse_single_house_trades, _parse_villa_trades
 from real_estate.mcp_server.tools.rent import get_single_house_rent, get_villa_rent
 from real_estate.mcp_server.tools.trade import get_single_house_trades, get_villa_trades
 
@@ -55,7 +56,7 @@ _XML_VILLA_OK = """<?xml version="1.0" encoding="UTF-8"?>
     </items>
     <totalCount>1</totalCount>
   </body>
-</response>"""
+</response>""".encode("utf-8")
 
 # ---------------------------------------------------------------------------
 # Single house (단독/다가구) XML fixtures
@@ -85,7 +86,7 @@ _XML_SINGLE_TRADE_OK = """<?xml version="1.0" encoding="UTF-8"?>
     </items>
     <totalCount>1</totalCount>
   </body>
-</response>"""
+</response>""".encode("utf-8")
 
 _XML_SINGLE_RENT_OK = """<?xml version="1.0" encoding="UTF-8"?>
 <response>
@@ -110,7 +111,7 @@ _XML_SINGLE_RENT_OK = """<?xml version="1.0" encoding="UTF-8"?>
     </items>
     <totalCount>1</totalCount>
   </body>
-</response>"""
+</response>""".encode("utf-8")
 
 _XML_VILLA_RENT_OK = """<?xml version="1.0" encoding="UTF-8"?>
 <response>
@@ -137,132 +138,27 @@ _XML_VILLA_RENT_OK = """<?xml version="1.0" encoding="UTF-8"?>
     </items>
     <totalCount>1</totalCount>
   </body>
-</response>"""
+</response>""".encode("utf-8")
 
 _XML_NO_DATA = """<?xml version="1.0" encoding="UTF-8"?>
 <response>
   <header><resultCode>03</resultCode><resultMsg>No Data</resultMsg></header>
   <body><items/><totalCount>0</totalCount></body>
-</response>"""
+</response>""".encode("utf-8")
 
 _VILLA_URL = "https://apis.data.go.kr/1613000/RTMSDataSvcRHTrade/getRTMSDataSvcRHTrade"
 _VILLA_RENT_URL = "https://apis.data.go.kr/1613000/RTMSDataSvcRHRent/getRTMSDataSvcRHRent"
 _SINGLE_TRADE_URL = "https://apis.data.go.kr/1613000/RTMSDataSvcSHTrade/getRTMSDataSvcSHTrade"
 _SINGLE_RENT_URL = "https://apis.data.go.kr/1613000/RTMSDataSvcSHRent/getRTMSDataSvcSHRent"
 
-
-# ---------------------------------------------------------------------------
-# Villa parse tests
-# ---------------------------------------------------------------------------
-
-
-class TestParseVillaTrades:
-    """Unit tests for villa (연립다세대) trade XML parsing."""
-
-    def test_cancelled_deal_excluded(self) -> None:
-        """cdealType=O item is excluded; 1 valid item returned."""
-        items, error_code = _parse_villa_trades(_XML_VILLA_OK)
-        assert error_code is None
-        assert len(items) == 1
-
-    def test_house_type_included(self) -> None:
-        """house_type field is present and correctly parsed."""
-        items, _ = _parse_villa_trades(_XML_VILLA_OK)
-        assert items[0]["house_type"] == "다세대"
-
-    def test_unit_name_from_mhouse_nm(self) -> None:
-        """unit_name is populated from mhouseNm."""
-        items, _ = _parse_villa_trades(_XML_VILLA_OK)
-        assert items[0]["unit_name"] == "신촌빌라"
-
-    def test_error_code_on_no_data(self) -> None:
-        """resultCode 03 returns error_code."""
-        items, error_code = _parse_villa_trades(_XML_NO_DATA)
-        assert error_code == "03"
-        assert items == []
-
-
-# ---------------------------------------------------------------------------
-# Single house parse tests
-# ---------------------------------------------------------------------------
-
-
-class TestParseSingleHouseTrades:
-    """Unit tests for detached/multi-unit house trade XML parsing."""
-
-    def test_normal_response_returns_item(self) -> None:
-        """Normal XML returns 1 item."""
-        items, error_code = _parse_single_house_trades(_XML_SINGLE_TRADE_OK)
-        assert error_code is None
-        assert len(items) == 1
-
-    def test_unit_name_is_empty_string(self) -> None:
-        """unit_name is always empty string (not provided by this API)."""
-        items, _ = _parse_single_house_trades(_XML_SINGLE_TRADE_OK)
-        assert items[0]["unit_name"] == ""
-
-    def test_floor_is_zero(self) -> None:
-        """floor is always 0 (not applicable for detached houses)."""
-        items, _ = _parse_single_house_trades(_XML_SINGLE_TRADE_OK)
-        assert items[0]["floor"] == 0
-
-    def test_area_from_total_floor_ar(self) -> None:
-        """area_sqm uses totalFloorAr (gross floor area)."""
-        items, _ = _parse_single_house_trades(_XML_SINGLE_TRADE_OK)
-        assert items[0]["area_sqm"] == 120.0
-
-    def test_empty_jibun_handled(self) -> None:
-        """Empty jibun field does not cause an error."""
-        items, _ = _parse_single_house_trades(_XML_SINGLE_TRADE_OK)
-        assert len(items) == 1  # no exception raised
-
-    def test_house_type_included(self) -> None:
-        """house_type field is parsed correctly."""
-        items, _ = _parse_single_house_trades(_XML_SINGLE_TRADE_OK)
-        assert items[0]["house_type"] == "단독"
-
-
-class TestParseVillaRent:
-    """Unit tests for row-house/multi-family rent XML parsing."""
-
-    def test_normal_response_returns_item(self) -> None:
-        """Normal XML returns 1 rent item."""
-        items, error_code = _parse_villa_rent(_XML_VILLA_RENT_OK)
-        assert error_code is None
-        assert len(items) == 1
-
-    def test_house_type_and_unit_name(self) -> None:
-        """house_type and unit_name are parsed correctly."""
-        items, _ = _parse_villa_rent(_XML_VILLA_RENT_OK)
-        assert items[0]["house_type"] == "연립"
-        assert items[0]["unit_name"] == "북악더테라스2단지"
-
-    def test_deposit_and_rent_parsed(self) -> None:
-        """deposit_10k and monthly_rent_10k are parsed correctly."""
-        items, _ = _parse_villa_rent(_XML_VILLA_RENT_OK)
-        assert items[0]["deposit_10k"] == 70000
-        assert items[0]["monthly_rent_10k"] == 0
-
-
-class TestParseSingleHouseRent:
-    """Unit tests for detached/multi-unit house rent XML parsing."""
-
-    def test_normal_response_returns_item(self) -> None:
-        """Normal XML returns 1 rent item."""
-        items, error_code = _parse_single_house_rent(_XML_SINGLE_RENT_OK)
-        assert error_code is None
-        assert len(items) == 1
-
-    def test_deposit_and_rent_parsed(self) -> None:
-        """deposit_10k and monthly_rent_10k are parsed correctly."""
-        items, _ = _parse_single_house_rent(_XML_SINGLE_RENT_OK)
-        assert items[0]["deposit_10k"] == 15000
-        assert items[0]["monthly_rent_10k"] == 60
-
-    def test_unit_name_is_empty_string(self) -> None:
-        """unit_name is always empty string."""
-        items, _ = _parse_single_house_rent(_XML_SINGLE_RENT_OK)
-        assert items[0]["unit_name"] == ""
+# Response objects built once at module scope: the Response constructor
+# sets up headers and wraps the body on every call, which is wasted work
+# for static fixtures served unchanged to every test
+_RESP_VILLA_OK = Response(200, content=_XML_VILLA_OK)
+_RESP_VILLA_RENT_OK = Response(200, content=_XML_VILLA_RENT_OK)
+_RESP_SINGLE_TRADE_OK = Response(200, content=_XML_SINGLE_TRADE_OK)
+_RESP_SINGLE_RENT_OK = Response(200, content=_XML_SINGLE_RENT_OK)
+_RESP_NO_DATA = Response(200, content=_XML_NO_DATA)
 
 
 # ---------------------------------------------------------------------------
@@ -278,44 +174,60 @@ class TestVillaSingleHouseTools:
         """Set a test API key environment variable."""
         monkeypatch.setenv("DATA_GO_KR_API_KEY", "test-key")
 
-    @respx.mock
+    @pytest.fixture(scope="class")
+    @staticmethod
+    def route_registry() -> "Iterator[dict[str, Response]]":
+        """Class-scoped respx router covering all four RTMS endpoints.
+
+        Routes are registered once for the whole class and read their
+        response from a registry dict, so individual tests only swap
+        response payloads instead of rebuilding a router each time.
+        """
+        registry: dict[str, Response] = {}
+        with respx.mock(assert_all_called=False) as router:
+            for url in (_VILLA_URL, _VILLA_RENT_URL, _SINGLE_TRADE_URL, _SINGLE_RENT_URL):
+                router.get(url).mock(side_effect=lambda request, url=url: registry[url])
+            yield registry
+
+    @pytest.fixture(autouse=True)
+    def default_responses(self, route_registry: dict[str, Response]) -> None:
+        """Reset the registry to the success fixtures before each test."""
+        route_registry.clear()
+        route_registry.update(
+            {
+                _VILLA_URL: _RESP_VILLA_OK,
+                _VILLA_RENT_URL: _RESP_VILLA_RENT_OK,
+                _SINGLE_TRADE_URL: _RESP_SINGLE_TRADE_OK,
+                _SINGLE_RENT_URL: _RESP_SINGLE_RENT_OK,
+            }
+        )
+
     async def test_villa_trades_success(self) -> None:
         """Villa trade tool returns items and summary on success."""
-        respx.get(_VILLA_URL).mock(return_value=Response(200, text=_XML_VILLA_OK))
-
         result = await get_villa_trades("11440", "202501")
 
         assert "error" not in result
         assert len(result["items"]) == 1
         assert result["items"][0]["house_type"] == "다세대"
 
-    @respx.mock
     async def test_single_house_trades_success(self) -> None:
         """Single house trade tool returns items and summary on success."""
-        respx.get(_SINGLE_TRADE_URL).mock(return_value=Response(200, text=_XML_SINGLE_TRADE_OK))
-
         result = await get_single_house_trades("11440", "202501")
 
         assert "error" not in result
         assert len(result["items"]) == 1
         assert result["items"][0]["unit_name"] == ""
 
-    @respx.mock
     async def test_single_house_rent_success(self) -> None:
         """Single house rent tool returns items and summary on success."""
-        respx.get(_SINGLE_RENT_URL).mock(return_value=Response(200, text=_XML_SINGLE_RENT_OK))
-
         result = await get_single_house_rent("11440", "202501")
 
         assert "error" not in result
         assert len(result["items"]) == 1
         assert "deposit_10k" in result["items"][0]
 
-    @respx.mock
     async def test_villa_rent_success(self) -> None:
         """Villa rent tool returns items and summary on success."""
-        respx.get(_VILLA_RENT_URL).mock(return_value=Response(200, text=_XML_VILLA_RENT_OK))
-
         result = await get_villa_rent("11440", "202501")
 
         assert "error" not in result
@@ -323,10 +235,9 @@ class TestVillaSingleHouseTools:
         assert result["items"][0]["house_type"] == "연립"
         assert result["summary"]["median_deposit_10k"] == 70000
 
-    @respx.mock
-    async def test_villa_no_data_error(self) -> None:
+    async def test_villa_no_data_error(self, route_registry: dict[str, Response]) -> None:
         """No-data response returns api_error."""
-        respx.get(_VILLA_URL).mock(return_value=Response(200, text=_XML_NO_DATA))
+        route_registry[_VILLA_URL] = _RESP_NO_DATA
 
         result = await get_villa_trades("11440", "200601")
 
@@ -0,0 +1,99 @@
+"""Shared fixtures for parser unit tests.
+
+The "normal response" XML skeletons used by several test classes are
+declared once here, pre-encoded to the bytes the parsers consume, and
+their parse results are session-scoped so tests
+that only assert on the parsed structure share a single parse instead
+of re-parsing (and re-encoding) the same literal per test.
+"""
+
+import pytest
+
+from real_estate.mcp_server.parsers.rent import _parse_apt_rent
+from real_estate.mcp_server.parsers.trade import _parse_apt_trades
+
+_APT_RENT_NORMAL_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<response>
+  <header>
+    <resultCode>000</resultCode>
+    <resultMsg>OK</resultMsg>
+  </header>
+  <body>
+    <items>
+      <item>
+        <aptNm>테스트아파트</aptNm>
+        <umdNm>합정동</umdNm>
+        <excluUseAr>84.97</excluUseAr>
+        <floor>12</floor>
+        <deposit>50,000</deposit>
+        <monthlyRent>0</monthlyRent>
+        <contractType>신규</contractType>
+        <dealYear>2025</dealYear>
+        <dealMonth>1</dealMonth>
+        <dealDay>10</dealDay>
+        <buildYear>2014</buildYear>
+        <cdealType></cdealType>
+      </item>
+    </items>
+    <totalCount>1</totalCount>
+  </body>
+</response>""".encode("utf-8")
+
+_APT_TRADE_NORMAL_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<response>
+  <header>
+    <resultCode>000</resultCode>
+    <resultMsg>OK</resultMsg>
+  </header>
+  <body>
+    <items>
+      <item>
+        <aptNm>테스트아파트</aptNm>
+        <umdNm>합정동</umdNm>
+        <excluUseAr>84.97</excluUseAr>
+        <floor>12</floor>
+        <dealAmount>135,000</dealAmount>
+        <dealYear>2025</dealYear>
+        <dealMonth>1</dealMonth>
+        <dealDay>15</dealDay>
+        <buildYear>2014</buildYear>
+        <dealingGbn>중개거래</dealingGbn>
+        <cdealType></cdealType>
+      </item>
+    </items>
+    <totalCount>1</totalCount>
+  </body>
+</response>""".encode("utf-8")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_parsers() -> None:
+    """Pay parser warm-up once before any test is timed.
+
+    The first parse of a session loads the ElementTree C extension and
+    runs the first iterparse allocation; warming both parser modules
+    here keeps that one-off cost out of whichever test happens to run
+    first.
+    """
+    _parse_apt_rent(_APT_RENT_NORMAL_XML)
+    _parse_apt_trades(_APT_TRADE_NORMAL_XML)
+
+
+@pytest.fixture(scope="session")
+def apt_rent_normal_xml() -> bytes:
+    return _APT_RENT_NORMAL_XML
+
+
+@pytest.fixture(scope="session")
+def apt_rent_normal_parsed(apt_rent_normal_xml: bytes) -> tuple[list[dict], str | None]:
+    return _parse_apt_rent(apt_rent_normal_xml)
+
+
+@pytest.fixture(scope="session")
+def apt_trade_normal_xml() -> bytes:
+    return _APT_TRADE_NORMAL_XML
+
+
+@pytest.fixture(scope="session")
+def apt_trade_normal_parsed(apt_trade_normal_xml: bytes) -> tuple[list[dict], str | None]:
+    return _parse_apt_trades(apt_trade_normal_xml)
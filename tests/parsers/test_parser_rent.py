@@ -15,13 +15,7 @@ from real_estate.mcp_server.parsers.rent import (
     _parse_villa_rent,
 )
 
-
-class TestParseAptRent:
-    """Unit tests for apartment rent XML parsing."""
-
-    def test_normal_response_returns_items(self) -> None:
-        """Normal XML returns items correctly parsed."""
-        xml_text = """<?xml version="1.0" encoding="UTF-8"?>
+_NORMAL_XML_TEMPLATE = """<?xml version="1.0" encoding="UTF-8"?>
 <response>
   <header>
     <resultCode>000</resultCode>
@@ -29,25 +23,27 @@ class TestParseAptRent:
   </header>
   <body>
     <items>
-      <item>
-        <aptNm>테스트아파트</aptNm>
-        <umdNm>합정동</umdNm>
-        <excluUseAr>84.97</excluUseAr>
-        <floor>12</floor>
-        <deposit>50,000</deposit>
-        <monthlyRent>0</monthlyRent>
-        <contractType>신규</contractType>
-        <dealYear>2025</dealYear>
-        <dealMonth>1</dealMonth>
-        <dealDay>10</dealDay>
-        <buildYear>2014</buildYear>
-        <cdealType></cdealType>
-      </item>
+      <item>{fields}</item>
     </items>
     <totalCount>1</totalCount>
   </body>
 </response>"""
-        items, error_code = _parse_apt_rent(xml_text)
+
+
+def _make_item_xml(fields: dict[str, str]) -> bytes:
+    """Build a single-item success response, pre-encoded for the parser."""
+    inner = "".join(f"<{tag}>{text}</{tag}>" for tag, text in fields.items())
+    return _NORMAL_XML_TEMPLATE.format(fields=inner).encode("utf-8")
+
+
+class TestParseAptRent:
+    """Unit tests for apartment rent XML parsing."""
+
+    def test_normal_response_returns_items(
+        self, apt_rent_normal_parsed: tuple[list[dict], str | None]
+    ) -> None:
+        """Normal XML returns items correctly parsed."""
+        items, error_code = apt_rent_normal_parsed
         assert error_code is None
         assert len(items) == 1
         assert items[0]["unit_name"] == "테스트아파트"
@@ -87,7 +83,7 @@ class TestParseAptRent:
     </items>
     <totalCount>1</totalCount>
   </body>
-</response>"""
+</response>""".encode("utf-8")
         items, _ = _parse_apt_rent(xml_text)
         assert items[0]["deposit_10k"] == 20000
         assert items[0]["monthly_rent_10k"] == 80
@@ -133,7 +129,7 @@ class TestParseAptRent:
     </items>
     <totalCount>2</totalCount>
   </body>
-</response>"""
+</response>""".encode("utf-8")
         items, _ = _parse_apt_rent(xml_text)
         assert len(items) == 1
         assert items[0]["unit_name"] == "정상거래"
@@ -179,7 +175,7 @@ class TestParseAptRent:
     </items>
     <totalCount>2</totalCount>
   </body>
-</response>"""
+</response>""".encode("utf-8")
         items, _ = _parse_apt_rent(xml_text)
         assert len(items) == 1
         assert items[0]["unit_name"] == "보증금있음"
@@ -196,127 +192,100 @@ class TestParseAptRent:
     <items/>
     <totalCount>0</totalCount>
   </body>
-</response>"""
+</response>""".encode("utf-8")
         items, error_code = _parse_apt_rent(xml_text)
         assert error_code == "03"
         assert items == []
 
 
-class TestParseOfficetelRent:
-    """Unit tests for officetel rent XML parsing."""
+class TestRentParserNormalResponses:
+    """One parametrized normal-response test per rent parser variant.
 
-    def test_normal_response_returns_items(self) -> None:
-        """Normal XML returns items correctly parsed."""
-        xml_text = """<?xml version="1.0" encoding="UTF-8"?>
-<response>
-  <header>
-    <resultCode>000</resultCode>
-    <resultMsg>OK</resultMsg>
-  </header>
-  <body>
-    <items>
-      <item>
-        <offiNm>테스트오피스텔</offiNm>
-        <umdNm>합정동</umdNm>
-        <excluUseAr>42.5</excluUseAr>
-        <floor>8</floor>
-        <deposit>10,000</deposit>
-        <monthlyRent>50</monthlyRent>
-        <contractType>신규</contractType>
-        <dealYear>2025</dealYear>
-        <dealMonth>2</dealMonth>
-        <dealDay>5</dealDay>
-        <buildYear>2018</buildYear>
-      </item>
-    </items>
-    <totalCount>1</totalCount>
-  </body>
-</response>"""
-        items, error_code = _parse_officetel_rent(xml_text)
-        assert error_code is None
-        assert len(items) == 1
-        assert items[0]["unit_name"] == "테스트오피스텔"
-        assert items[0]["deposit_10k"] == 10000
-        assert items[0]["monthly_rent_10k"] == 50
-
-
-class TestParseVillaRent:
-    """Unit tests for villa (row-house/multi-family) rent XML parsing."""
-
-    def test_normal_response_returns_items(self) -> None:
-        """Normal XML returns items with house_type."""
-        xml_text = """<?xml version="1.0" encoding="UTF-8"?>
-<response>
-  <header>
-    <resultCode>000</resultCode>
-    <resultMsg>OK</resultMsg>
-  </header>
-  <body>
-    <items>
-      <item>
-        <mhouseNm>테스트빌라</mhouseNm>
-        <umdNm>연남동</umdNm>
-        <houseType>다세대</houseType>
-        <excluUseAr>65.0</excluUseAr>
-        <floor>3</floor>
-        <deposit>15,000</deposit>
-        <monthlyRent>30</monthlyRent>
-        <contractType>신규</contractType>
-        <dealYear>2025</dealYear>
-        <dealMonth>1</dealMonth>
-        <dealDay>20</dealDay>
-        <buildYear>2005</buildYear>
-      </item>
-    </items>
-    <totalCount>1</totalCount>
-  </body>
-</response>"""
-        items, error_code = _parse_villa_rent(xml_text)
-        assert error_code is None
-        assert len(items) == 1
-        assert items[0]["unit_name"] == "테스트빌라"
-        assert items[0]["house_type"] == "다세대"
-        assert items[0]["deposit_10k"] == 15000
-        assert items[0]["monthly_rent_10k"] == 30
+    The per-variant XML differs only in a few tags, so each case supplies
+    its item fields and the expected parsed values.
+    """
 
-
-class TestParseSingleHouseRent:
-    """Unit tests for single/detached house rent XML parsing."""
-
-    def test_normal_response_returns_items(self) -> None:
-        """Normal XML returns items with totalFloorAr as area."""
-        xml_text = """<?xml version="1.0" encoding="UTF-8"?>
-<response>
-  <header>
-    <resultCode>000</resultCode>
-    <resultMsg>OK</resultMsg>
-  </header>
-  <body>
-    <items>
-      <item>
-        <umdNm>성수동</umdNm>
-        <houseType>단독</houseType>
-        <totalFloorAr>120.0</totalFloorAr>
-        <deposit>80,000</deposit>
-        <monthlyRent>0</monthlyRent>
-        <contractType>신규</contractType>
-        <dealYear>2025</dealYear>
-        <dealMonth>1</dealMonth>
-        <dealDay>8</dealDay>
-        <buildYear>1990</buildYear>
-      </item>
-    </items>
-    <totalCount>1</totalCount>
-  </body>
-</response>"""
-        items, error_code = _parse_single_house_rent(xml_text)
+    @pytest.mark.parametrize(
+        ("parser", "fields", "expected"),
+        [
+            pytest.param(
+                _parse_officetel_rent,
+                {
+                    "offiNm": "테스트오피스텔",
+                    "umdNm": "합정동",
+                    "excluUseAr": "42.5",
+                    "floor": "8",
+                    "deposit": "10,000",
+                    "monthlyRent": "50",
+                    "contractType": "신규",
+                    "dealYear": "2025",
+                    "dealMonth": "2",
+                    "dealDay": "5",
+                    "buildYear": "2018",
+                },
+                {
+                    "unit_name": "테스트오피스텔",
+                    "deposit_10k": 10000,
+                    "monthly_rent_10k": 50,
+                },
+                id="officetel",
+            ),
+            pytest.param(
+                _parse_villa_rent,
+                {
+                    "mhouseNm": "테스트빌라",
+                    "umdNm": "연남동",
+                    "houseType": "다세대",
+                    "excluUseAr": "65.0",
+                    "floor": "3",
+                    "deposit": "15,000",
+                    "monthlyRent": "30",
+                    "contractType": "신규",
+                    "dealYear": "2025",
+                    "dealMonth": "1",
+                    "dealDay": "20",
+                    "buildYear": "2005",
+                },
+                {
+                    "unit_name": "테스트빌라",
+                    "house_type": "다세대",
+                    "deposit_10k": 15000,
+                    "monthly_rent_10k": 30,
+                },
+                id="villa",
+            ),
+            pytest.param(
+                _parse_single_house_rent,
+                {
+                    "umdNm": "성수동",
+                    "houseType": "단독",
+                    "totalFloorAr": "120.0",
+                    "deposit": "80,000",
+                    "monthlyRent": "0",
+                    "contractType": "신규",
+                    "dealYear": "2025",
+                    "dealMonth": "1",
+                    "dealDay": "8",
+                    "buildYear": "1990",
+                },
+                {
+                    "unit_name": "",  # not provided by this API
+                    "house_type": "단독",
+                    "area_sqm": 120.0,
+                    "deposit_10k": 80000,
+                    "monthly_rent_10k": 0,
+                },
+                id="single_house",
+            ),
+        ],
+    )
+    def test_normal_response_returns_items(self, parser, fields, expected) -> None:
+        """Normal XML returns one item with the variant's expected fields."""
+        items, error_code = parser(_make_item_xml(fields))
         assert error_code is None
         assert len(items) == 1
-        assert items[0]["unit_name"] == ""  # Not provided
-        assert items[0]["house_type"] == "단독"
-        assert items[0]["area_sqm"] == 120.0
-        assert items[0]["deposit_10k"] == 80000
-        assert items[0]["monthly_rent_10k"] == 0
+        for key, value in expected.items():
+            assert items[0][key] == value
 
 
 class TestRentParserEdgeCases:
@@ -334,7 +303,7 @@ class TestRentParserEdgeCases:
     <items/>
     <totalCount>0</totalCount>
   </body>
-</response>"""
+</response>""".encode("utf-8")
         items, error_code = _parse_apt_rent(xml_text)
         assert error_code is None
         assert items == []
@@ -366,7 +335,7 @@ class TestRentParserEdgeCases:
     </items>
     <totalCount>1</totalCount>
   </body>
-</response>"""
+</response>""".encode("utf-8")
         items, _ = _parse_apt_rent(xml_text)
         assert items[0]["deposit_10k"] == 1234567
 
@@ -397,7 +366,7 @@ class TestRentParserEdgeCases:
     </items>
     <totalCount>1</totalCount>
   </body>
-</response>"""
+</response>""".encode("utf-8")
         items, _ = _parse_apt_rent(xml_text)
         assert len(items) == 1
         assert items[0]["dong"] == ""
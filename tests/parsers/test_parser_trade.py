@@ -10,19 +10,14 @@ import pytest
 
 from real_estate.mcp_server.parsers.trade import (
     _parse_apt_trades,
+    _parse_apt_trades_batch,
     _parse_commercial_trade,
     _parse_officetel_trades,
     _parse_single_house_trades,
     _parse_villa_trades,
 )
 
-
-class TestParseAptTrades:
-    """Unit tests for apartment trade XML parsing."""
-
-    def test_normal_response_returns_items(self) -> None:
-        """Normal XML returns items correctly parsed."""
-        xml_text = """<?xml version="1.0" encoding="UTF-8"?>
+_NORMAL_XML_TEMPLATE = """<?xml version="1.0" encoding="UTF-8"?>
 <response>
   <header>
     <resultCode>000</resultCode>
@@ -30,24 +25,27 @@ class TestParseAptTrades:
   </header>
   <body>
     <items>
-      <item>
-        <aptNm>테스트아파트</aptNm>
-        <umdNm>합정동</umdNm>
-        <excluUseAr>84.97</excluUseAr>
-        <floor>12</floor>
-        <dealAmount>135,000</dealAmount>
-        <dealYear>2025</dealYear>
-        <dealMonth>1</dealMonth>
-        <dealDay>15</dealDay>
-        <buildYear>2014</buildYear>
-        <dealingGbn>중개거래</dealingGbn>
-        <cdealType></cdealType>
-      </item>
+      <item>{fields}</item>
     </items>
     <totalCount>1</totalCount>
   </body>
 </response>"""
-        items, error_code = _parse_apt_trades(xml_text)
+
+
+def _make_item_xml(fields: dict[str, str]) -> bytes:
+    """Build a single-item success response, pre-encoded for the parser."""
+    inner = "".join(f"<{tag}>{text}</{tag}>" for tag, text in fields.items())
+    return _NORMAL_XML_TEMPLATE.format(fields=inner).encode("utf-8")
+
+
+class TestParseAptTrades:
+    """Unit tests for apartment trade XML parsing."""
+
+    def test_normal_response_returns_items(
+        self, apt_trade_normal_parsed: tuple[list[dict], str | None]
+    ) -> None:
+        """Normal XML returns items correctly parsed."""
+        items, error_code = apt_trade_normal_parsed
         assert error_code is None
         assert len(items) == 1
         assert items[0]["apt_name"] == "테스트아파트"
@@ -98,7 +96,7 @@ class TestParseAptTrades:
     </items>
     <totalCount>2</totalCount>
   </body>
-</response>"""
+</response>""".encode("utf-8")
         items, _ = _parse_apt_trades(xml_text)
         assert len(items) == 1
         assert items[0]["apt_name"] == "정상거래"
@@ -142,7 +140,7 @@ class TestParseAptTrades:
     </items>
     <totalCount>2</totalCount>
   </body>
-</response>"""
+</response>""".encode("utf-8")
         items, _ = _parse_apt_trades(xml_text)
         assert len(items) == 1
         assert items[0]["apt_name"] == "가격있음"
@@ -159,7 +157,7 @@ class TestParseAptTrades:
     <items/>
     <totalCount>0</totalCount>
   </body>
-</response>"""
+</response>""".encode("utf-8")
         items, error_code = _parse_apt_trades(xml_text)
         assert error_code == "03"
         assert items == []
@@ -190,169 +188,154 @@ class TestParseAptTrades:
     </items>
     <totalCount>1</totalCount>
   </body>
-</response>"""
+</response>""".encode("utf-8")
         items, _ = _parse_apt_trades(xml_text)
         assert items[0]["trade_date"] == "2025-03-05"
 
 
-class TestParseOfficetelTrades:
-    """Unit tests for officetel trade XML parsing."""
+class TestParseAptTradesBatch:
+    """Unit tests for the paged batch entry point."""
 
-    def test_normal_response_returns_items(self) -> None:
-        """Normal XML returns items correctly parsed."""
-        xml_text = """<?xml version="1.0" encoding="UTF-8"?>
+    def test_batch_preserves_per_doc_results(self, apt_trade_normal_xml: bytes) -> None:
+        """Each document keeps its own (items, error_code) result."""
+        error_xml = """<?xml version="1.0" encoding="UTF-8"?>
 <response>
   <header>
-    <resultCode>000</resultCode>
-    <resultMsg>OK</resultMsg>
+    <resultCode>03</resultCode>
+    <resultMsg>No Data</resultMsg>
   </header>
   <body>
-    <items>
-      <item>
-        <offiNm>테스트오피스텔</offiNm>
-        <umdNm>합정동</umdNm>
-        <excluUseAr>42.5</excluUseAr>
-        <floor>8</floor>
-        <dealAmount>35,000</dealAmount>
-        <dealYear>2025</dealYear>
-        <dealMonth>2</dealMonth>
-        <dealDay>10</dealDay>
-        <buildYear>2018</buildYear>
-        <dealingGbn>중개거래</dealingGbn>
-        <cdealType></cdealType>
-      </item>
-    </items>
-    <totalCount>1</totalCount>
+    <items/>
+    <totalCount>0</totalCount>
   </body>
-</response>"""
-        items, error_code = _parse_officetel_trades(xml_text)
+</response>""".encode("utf-8")
+        results = _parse_apt_trades_batch([apt_trade_normal_xml, error_xml])
+        assert len(results) == 2
+        items, error_code = results[0]
         assert error_code is None
-        assert len(items) == 1
-        assert items[0]["unit_name"] == "테스트오피스텔"
-        assert items[0]["area_sqm"] == 42.5
-        assert items[0]["price_10k"] == 35000
-
-
-class TestParseVillaTrades:
-    """Unit tests for villa (row-house/multi-family) trade XML parsing."""
+        assert items[0]["apt_name"] == "테스트아파트"
+        assert results[1] == ([], "03")
 
-    def test_normal_response_returns_items(self) -> None:
-        """Normal XML returns items with house_type."""
-        xml_text = """<?xml version="1.0" encoding="UTF-8"?>
-<response>
-  <header>
-    <resultCode>000</resultCode>
-    <resultMsg>OK</resultMsg>
-  </header>
-  <body>
-    <items>
-      <item>
-        <mhouseNm>테스트빌라</mhouseNm>
-        <umdNm>연남동</umdNm>
-        <houseType>다세대</houseType>
-        <excluUseAr>65.0</excluUseAr>
-        <floor>3</floor>
-        <dealAmount>55,000</dealAmount>
-        <dealYear>2025</dealYear>
-        <dealMonth>1</dealMonth>
-        <dealDay>5</dealDay>
-        <buildYear>2005</buildYear>
-        <dealingGbn>직거래</dealingGbn>
-        <cdealType></cdealType>
-      </item>
-    </items>
-    <totalCount>1</totalCount>
-  </body>
-</response>"""
-        items, error_code = _parse_villa_trades(xml_text)
-        assert error_code is None
-        assert len(items) == 1
-        assert items[0]["unit_name"] == "테스트빌라"
-        assert items[0]["house_type"] == "다세대"
-        assert items[0]["price_10k"] == 55000
 
+class TestTradeParserNormalResponses:
+    """One parametrized normal-response test per trade parser variant.
 
-class TestParseSingleHouseTrades:
-    """Unit tests for single/detached house trade XML parsing."""
+    The per-variant XML differs only in a few tags, so each case supplies
+    its item fields and the expected parsed values.
+    """
 
-    def test_normal_response_returns_items(self) -> None:
-        """Normal XML returns items with totalFloorAr as area."""
-        xml_text = """<?xml version="1.0" encoding="UTF-8"?>
-<response>
-  <header>
-    <resultCode>000</resultCode>
-    <resultMsg>OK</resultMsg>
-  </header>
-  <body>
-    <items>
-      <item>
-        <umdNm>성수동</umdNm>
-        <houseType>단독</houseType>
-        <totalFloorAr>120.0</totalFloorAr>
-        <dealAmount>180,000</dealAmount>
-        <dealYear>2025</dealYear>
-        <dealMonth>1</dealMonth>
-        <dealDay>25</dealDay>
-        <buildYear>1990</buildYear>
-        <dealingGbn>중개거래</dealingGbn>
-        <cdealType></cdealType>
-      </item>
-    </items>
-    <totalCount>1</totalCount>
-  </body>
-</response>"""
-        items, error_code = _parse_single_house_trades(xml_text)
+    @pytest.mark.parametrize(
+        ("parser", "fields", "expected"),
+        [
+            pytest.param(
+                _parse_officetel_trades,
+                {
+                    "offiNm": "테스트오피스텔",
+                    "umdNm": "합정동",
+                    "excluUseAr": "42.5",
+                    "floor": "8",
+                    "dealAmount": "35,000",
+                    "dealYear": "2025",
+                    "dealMonth": "2",
+                    "dealDay": "10",
+                    "buildYear": "2018",
+                    "dealingGbn": "중개거래",
+                    "cdealType": "",
+                },
+                {
+                    "unit_name": "테스트오피스텔",
+                    "area_sqm": 42.5,
+                    "price_10k": 35000,
+                },
+                id="officetel",
+            ),
+            pytest.param(
+                _parse_villa_trades,
+                {
+                    "mhouseNm": "테스트빌라",
+                    "umdNm": "연남동",
+                    "houseType": "다세대",
+                    "excluUseAr": "65.0",
+                    "floor": "3",
+                    "dealAmount": "55,000",
+                    "dealYear": "2025",
+                    "dealMonth": "1",
+                    "dealDay": "5",
+                    "buildYear": "2005",
+                    "dealingGbn": "직거래",
+                    "cdealType": "",
+                },
+                {
+                    "unit_name": "테스트빌라",
+                    "house_type": "다세대",
+                    "price_10k": 55000,
+                },
+                id="villa",
+            ),
+            pytest.param(
+                _parse_single_house_trades,
+                {
+                    "umdNm": "성수동",
+                    "houseType": "단독",
+                    "totalFloorAr": "120.0",
+                    "dealAmount": "180,000",
+                    "dealYear": "2025",
+                    "dealMonth": "1",
+                    "dealDay": "25",
+                    "buildYear": "1990",
+                    "dealingGbn": "중개거래",
+                    "cdealType": "",
+                },
+                {
+                    "unit_name": "",  # not provided by this API
+                    "house_type": "단독",
+                    "area_sqm": 120.0,
+                    "floor": 0,  # not applicable
+                    "price_10k": 180000,
+                },
+                id="single_house",
+            ),
+            pytest.param(
+                _parse_commercial_trade,
+                {
+                    "buildingType": "근린생활시설",
+                    "buildingUse": "상가",
+                    "landUse": "상업지역",
+                    "umdNm": "역삼동",
+                    "buildingAr": "150.0",
+                    "floor": "1",
+                    "dealAmount": "500,000",
+                    "dealYear": "2025",
+                    "dealMonth": "2",
+                    "dealDay": "1",
+                    "buildYear": "2015",
+                    "dealingGbn": "중개거래",
+                    "cdealtype": "",
+                    "shareDealingType": "",
+                },
+                {
+                    "building_type": "근린생활시설",
+                    "building_use": "상가",
+                    "land_use": "상업지역",
+                    "building_ar": 150.0,
+                    "price_10k": 500000,
+                },
+                id="commercial",
+            ),
+        ],
+    )
+    def test_normal_response_returns_items(self, parser, fields, expected) -> None:
+        """Normal XML returns one item with the variant's expected fields."""
+        items, error_code = parser(_make_item_xml(fields))
         assert error_code is None
         assert len(items) == 1
-        assert items[0]["unit_name"] == ""  # Not provided
-        assert items[0]["house_type"] == "단독"
-        assert items[0]["area_sqm"] == 120.0
-        assert items[0]["floor"] == 0  # Not applicable
-        assert items[0]["price_10k"] == 180000
+        for key, value in expected.items():
+            assert items[0][key] == value
 
 
 class TestParseCommercialTrade:
     """Unit tests for commercial building trade XML parsing."""
 
-    def test_normal_response_returns_items(self) -> None:
-        """Normal XML returns items with commercial-specific fields."""
-        xml_text = """<?xml version="1.0" encoding="UTF-8"?>
-<response>
-  <header>
-    <resultCode>000</resultCode>
-    <resultMsg>OK</resultMsg>
-  </header>
-  <body>
-    <items>
-      <item>
-        <buildingType>근린생활시설</buildingType>
-        <buildingUse>상가</buildingUse>
-        <landUse>상업지역</landUse>
-        <umdNm>역삼동</umdNm>
-        <buildingAr>150.0</buildingAr>
-        <floor>1</floor>
-        <dealAmount>500,000</dealAmount>
-        <dealYear>2025</dealYear>
-        <dealMonth>2</dealMonth>
-        <dealDay>1</dealDay>
-        <buildYear>2015</buildYear>
-        <dealingGbn>중개거래</dealingGbn>
-        <cdealtype></cdealtype>
-        <shareDealingType></shareDealingType>
-      </item>
-    </items>
-    <totalCount>1</totalCount>
-  </body>
-</response>"""
-        items, error_code = _parse_commercial_trade(xml_text)
-        assert error_code is None
-        assert len(items) == 1
-        assert items[0]["building_type"] == "근린생활시설"
-        assert items[0]["building_use"] == "상가"
-        assert items[0]["land_use"] == "상업지역"
-        assert items[0]["building_ar"] == 150.0
-        assert items[0]["price_10k"] == 500000
-
     def test_cancelled_deal_with_lowercase_tag_excluded(self) -> None:
         """Items with cdealtype=O (lowercase) are excluded."""
         xml_text = """<?xml version="1.0" encoding="UTF-8"?>
@@ -382,7 +365,7 @@ class TestParseCommercialTrade:
     </items>
     <totalCount>1</totalCount>
   </body>
-</response>"""
+</response>""".encode("utf-8")
         items, _ = _parse_commercial_trade(xml_text)
         assert len(items) == 0
 
@@ -402,7 +385,7 @@ class TestTradeParserEdgeCases:
     <items/>
     <totalCount>0</totalCount>
   </body>
-</response>"""
+</response>""".encode("utf-8")
         items, error_code = _parse_apt_trades(xml_text)
         assert error_code is None
         assert items == []
@@ -433,7 +416,7 @@ class TestTradeParserEdgeCases:
     </items>
     <totalCount>1</totalCount>
   </body>
-</response>"""
+</response>""".encode("utf-8")
         items, _ = _parse_apt_trades(xml_text)
         assert items[0]["price_10k"] == 1234567
 
@@ -463,7 +446,7 @@ class TestTradeParserEdgeCases:
     </items>
     <totalCount>1</totalCount>
   </body>
-</response>"""
+</response>""".encode("utf-8")
         items, _ = _parse_apt_trades(xml_text)
         assert len(items) == 1
         assert items[0]["dong"] == ""
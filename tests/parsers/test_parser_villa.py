@@ -0,0 +1,278 @@
+"""Unit tests for villa (연립다세대) and single house (단독/다가구) XML parsers.
+
+These tests validate the parsing logic only; the MCP tools built on top
+of these parsers are covered in tests/mcp_server/test_villa_single_house.py.
+"""
+
+import pytest
+
+from real_estate.mcp_server.parsers.rent import _parse_single_house_rent, _parse_villa_rent
+from real_estate.mcp_server.parsers.trade import _parse_single_house_trades, _parse_villa_trades
+
+# ---------------------------------------------------------------------------
+# XML fixtures (pre-encoded to bytes so parsers skip the decode round trip)
+# ---------------------------------------------------------------------------
+
+_XML_VILLA_OK = """<?xml version="1.0" encoding="UTF-8"?>
+<response>
+  <header>
+    <resultCode>000</resultCode>
+    <resultMsg>OK</resultMsg>
+  </header>
+  <body>
+    <items>
+      <item>
+        <mhouseNm>신촌빌라</mhouseNm>
+        <umdNm>신촌동</umdNm>
+        <houseType>다세대</houseType>
+        <excluUseAr>49.50</excluUseAr>
+        <floor>3</floor>
+        <dealAmount>25,000</dealAmount>
+        <dealYear>2025</dealYear>
+        <dealMonth>1</dealMonth>
+        <dealDay>8</dealDay>
+        <buildYear>2005</buildYear>
+        <dealingGbn>중개거래</dealingGbn>
+        <cdealType></cdealType>
+      </item>
+      <item>
+        <mhouseNm>취소빌라</mhouseNm>
+        <umdNm>신촌동</umdNm>
+        <houseType>연립</houseType>
+        <excluUseAr>60.00</excluUseAr>
+        <floor>2</floor>
+        <dealAmount>30,000</dealAmount>
+        <dealYear>2025</dealYear>
+        <dealMonth>1</dealMonth>
+        <dealDay>12</dealDay>
+        <buildYear>2003</buildYear>
+        <dealingGbn>중개거래</dealingGbn>
+        <cdealType>O</cdealType>
+      </item>
+    </items>
+    <totalCount>1</totalCount>
+  </body>
+</response>""".encode("utf-8")
+
+_XML_SINGLE_TRADE_OK = """<?xml version="1.0" encoding="UTF-8"?>
+<response>
+  <header>
+    <resultCode>000</resultCode>
+    <resultMsg>OK</resultMsg>
+  </header>
+  <body>
+    <items>
+      <item>
+        <umdNm>연남동</umdNm>
+        <houseType>단독</houseType>
+        <totalFloorAr>120.00</totalFloorAr>
+        <dealAmount>80,000</dealAmount>
+        <dealYear>2025</dealYear>
+        <dealMonth>1</dealMonth>
+        <dealDay>20</dealDay>
+        <buildYear>1995</buildYear>
+        <dealingGbn>중개거래</dealingGbn>
+        <cdealType></cdealType>
+        <jibun></jibun>
+      </item>
+    </items>
+    <totalCount>1</totalCount>
+  </body>
+</response>""".encode("utf-8")
+
+_XML_SINGLE_RENT_OK = """<?xml version="1.0" encoding="UTF-8"?>
+<response>
+  <header>
+    <resultCode>000</resultCode>
+    <resultMsg>OK</resultMsg>
+  </header>
+  <body>
+    <items>
+      <item>
+        <umdNm>연남동</umdNm>
+        <houseType>다가구</houseType>
+        <totalFloorAr>85.00</totalFloorAr>
+        <deposit>15,000</deposit>
+        <monthlyRent>60</monthlyRent>
+        <contractType>신규</contractType>
+        <dealYear>2025</dealYear>
+        <dealMonth>1</dealMonth>
+        <dealDay>15</dealDay>
+        <buildYear>2000</buildYear>
+      </item>
+    </items>
+    <totalCount>1</totalCount>
+  </body>
+</response>""".encode("utf-8")
+
+_XML_VILLA_RENT_OK = """<?xml version="1.0" encoding="UTF-8"?>
+<response>
+  <header>
+    <resultCode>000</resultCode>
+    <resultMsg>OK</resultMsg>
+  </header>
+  <body>
+    <items>
+      <item>
+        <mhouseNm>북악더테라스2단지</mhouseNm>
+        <umdNm>신영동</umdNm>
+        <houseType>연립</houseType>
+        <excluUseAr>84.99</excluUseAr>
+        <floor>-1</floor>
+        <deposit>70,000</deposit>
+        <monthlyRent>0</monthlyRent>
+        <contractType> </contractType>
+        <dealYear>2024</dealYear>
+        <dealMonth>7</dealMonth>
+        <dealDay>10</dealDay>
+        <buildYear>2019</buildYear>
+      </item>
+    </items>
+    <totalCount>1</totalCount>
+  </body>
+</response>""".encode("utf-8")
+
+_XML_NO_DATA = """<?xml version="1.0" encoding="UTF-8"?>
+<response>
+  <header><resultCode>03</resultCode><resultMsg>No Data</resultMsg></header>
+  <body><items/><totalCount>0</totalCount></body>
+</response>""".encode("utf-8")
+
+
+# ---------------------------------------------------------------------------
+# Parsed fixtures (module-scoped so each OK fixture is parsed only once)
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture(scope="module")
+def villa_ok_parsed() -> tuple[list[dict], str | None]:
+    return _parse_villa_trades(_XML_VILLA_OK)
+
+
+@pytest.fixture(scope="module")
+def single_trade_ok_parsed() -> tuple[list[dict], str | None]:
+    return _parse_single_house_trades(_XML_SINGLE_TRADE_OK)
+
+
+@pytest.fixture(scope="module")
+def villa_rent_ok_parsed() -> tuple[list[dict], str | None]:
+    return _parse_villa_rent(_XML_VILLA_RENT_OK)
+
+
+@pytest.fixture(scope="module")
+def single_rent_ok_parsed() -> tuple[list[dict], str | None]:
+    return _parse_single_house_rent(_XML_SINGLE_RENT_OK)
+
+
+# ---------------------------------------------------------------------------
+# Villa parse tests
+# ---------------------------------------------------------------------------
+
+
+class TestParseVillaTrades:
+    """Unit tests for villa (연립다세대) trade XML parsing."""
+
+    def test_cancelled_deal_excluded(self, villa_ok_parsed) -> None:
+        """cdealType=O item is excluded; 1 valid item returned."""
+        items, error_code = villa_ok_parsed
+        assert error_code is None
+        assert len(items) == 1
+
+    def test_house_type_included(self, villa_ok_parsed) -> None:
+        """house_type field is present and correctly parsed."""
+        items, _ = villa_ok_parsed
+        assert items[0]["house_type"] == "다세대"
+
+    def test_unit_name_from_mhouse_nm(self, villa_ok_parsed) -> None:
+        """unit_name is populated from mhouseNm."""
+        items, _ = villa_ok_parsed
+        assert items[0]["unit_name"] == "신촌빌라"
+
+    def test_error_code_on_no_data(self) -> None:
+        """resultCode 03 returns error_code."""
+        items, error_code = _parse_villa_trades(_XML_NO_DATA)
+        assert error_code == "03"
+        assert items == []
+
+
+# ---------------------------------------------------------------------------
+# Single house parse tests
+# ---------------------------------------------------------------------------
+
+
+class TestParseSingleHouseTrades:
+    """Unit tests for detached/multi-unit house trade XML parsing."""
+
+    def test_normal_response_returns_item(self, single_trade_ok_parsed) -> None:
+        """Normal XML returns 1 item."""
+        items, error_code = single_trade_ok_parsed
+        assert error_code is None
+        assert len(items) == 1
+
+    def test_unit_name_is_empty_string(self, single_trade_ok_parsed) -> None:
+        """unit_name is always empty string (not provided by this API)."""
+        items, _ = single_trade_ok_parsed
+        assert items[0]["unit_name"] == ""
+
+    def test_floor_is_zero(self, single_trade_ok_parsed) -> None:
+        """floor is always 0 (not applicable for detached houses)."""
+        items, _ = single_trade_ok_parsed
+        assert items[0]["floor"] == 0
+
+    def test_area_from_total_floor_ar(self, single_trade_ok_parsed) -> None:
+        """area_sqm uses totalFloorAr (gross floor area)."""
+        items, _ = single_trade_ok_parsed
+        assert items[0]["area_sqm"] == 120.0
+
+    def test_empty_jibun_handled(self, single_trade_ok_parsed) -> None:
+        """Empty jibun field does not cause an error."""
+        items, _ = single_trade_ok_parsed
+        assert len(items) == 1  # no exception raised
+
+    def test_house_type_included(self, single_trade_ok_parsed) -> None:
+        """house_type field is parsed correctly."""
+        items, _ = single_trade_ok_parsed
+        assert items[0]["house_type"] == "단독"
+
+
+class TestParseVillaRent:
+    """Unit tests for row-house/multi-family rent XML parsing."""
+
+    def test_normal_response_returns_item(self, villa_rent_ok_parsed) -> None:
+        """Normal XML returns 1 rent item."""
+        items, error_code = villa_rent_ok_parsed
+        assert error_code is None
+        assert len(items) == 1
+
+    def test_house_type_and_unit_name(self, villa_rent_ok_parsed) -> None:
+        """house_type and unit_name are parsed correctly."""
+        items, _ = villa_rent_ok_parsed
+        assert items[0]["house_type"] == "연립"
+        assert items[0]["unit_name"] == "북악더테라스2단지"
+
+    def test_deposit_and_rent_parsed(self, villa_rent_ok_parsed) -> None:
+        """deposit_10k and monthly_rent_10k are parsed correctly."""
+        items, _ = villa_rent_ok_parsed
+        assert items[0]["deposit_10k"] == 70000
+        assert items[0]["monthly_rent_10k"] == 0
+
+
+class TestParseSingleHouseRent:
+    """Unit tests for detached/multi-unit house rent XML parsing."""
+
+    def test_normal_response_returns_item(self, single_rent_ok_parsed) -> None:
+        """Normal XML returns 1 rent item."""
+        items, error_code = single_rent_ok_parsed
+        assert error_code is None
+        assert len(items) == 1
+
+    def test_deposit_and_rent_parsed(self, single_rent_ok_parsed) -> None:
+        """deposit_10k and monthly_rent_10k are parsed correctly."""
+        items, _ = single_rent_ok_parsed
+        assert items[0]["deposit_10k"] == 15000
+        assert items[0]["monthly_rent_10k"] == 60
+
+    def test_unit_name_is_empty_string(self, single_rent_ok_parsed) -> None:
+        """unit_name is always empty string."""
+        items, _ = single_rent_ok_parsed
+        assert items[0]["unit_name"] == ""
@@ -15,6 +15,30 @@ from typing import Any
 
 import pytest
 from pydantic import ValidationError
+from pydantic_settings import BaseSettings
+
+import real_estate.config_validator as config_module
+from real_estate.config_validator import AppSettings
+
+# Snapshot the declared field names once; model_fields goes through
+# pydantic's metaclass attribute dispatch on every access
+_APP_FIELDS = frozenset(AppSettings.model_fields)
+
+
+@pytest.fixture
+def make_settings():
+    """Build AppSettings from explicit kwargs, skipping .env discovery.
+
+    Constructor kwargs take priority over every other settings source,
+    so tests that only exercise fallback logic can state their inputs
+    directly instead of staging os.environ through monkeypatch.
+    """
+
+    def _make(**kwargs: Any) -> AppSettings:
+        return AppSettings(_env_file=None, **kwargs)
+
+    return _make
+
 
 # ---------------------------------------------------------------------------
 # TASK-001: AppSettings class existence and basic fields tests (RED)
@@ -26,50 +50,31 @@ class TestAppSettingsExists:
 
     def test_app_settings_class_can_be_imported(self) -> None:
         """AppSettings class should be importable from config_validator."""
-        from real_estate.config_validator import AppSettings  # noqa: F401
+        import importlib
 
-        assert True  # Import succeeded
+        module = importlib.import_module("real_estate.config_validator")
+        assert hasattr(module, "AppSettings")
 
     def test_app_settings_is_pydantic_settings_subclass(self) -> None:
         """AppSettings should inherit from pydantic_settings.BaseSettings."""
-        from pydantic_settings import BaseSettings
-
-        from real_estate.config_validator import AppSettings
-
         assert issubclass(AppSettings, BaseSettings)
 
 
 class TestAppSettingsBasicFields:
     """Tests for basic field definitions in AppSettings."""
 
-    def test_app_settings_has_data_go_kr_api_key_field(self) -> None:
-        """AppSettings should have data_go_kr_api_key field."""
-        from real_estate.config_validator import AppSettings
-
-        # Get field info from model
-        fields = AppSettings.model_fields
-        assert "data_go_kr_api_key" in fields
-
-    def test_app_settings_has_onbid_api_key_field(self) -> None:
-        """AppSettings should have onbid_api_key field (optional)."""
-        from real_estate.config_validator import AppSettings
-
-        fields = AppSettings.model_fields
-        assert "onbid_api_key" in fields
-
-    def test_app_settings_has_odcloud_api_key_field(self) -> None:
-        """AppSettings should have odcloud_api_key field (optional)."""
-        from real_estate.config_validator import AppSettings
-
-        fields = AppSettings.model_fields
-        assert "odcloud_api_key" in fields
-
-    def test_app_settings_has_odcloud_service_key_field(self) -> None:
-        """AppSettings should have odcloud_service_key field (optional)."""
-        from real_estate.config_validator import AppSettings
-
-        fields = AppSettings.model_fields
-        assert "odcloud_service_key" in fields
+    @pytest.mark.parametrize(
+        "field_name",
+        [
+            "data_go_kr_api_key",
+            "onbid_api_key",
+            "odcloud_api_key",
+            "odcloud_service_key",
+        ],
+    )
+    def test_app_settings_has_field(self, field_name: str) -> None:
+        """AppSettings should define each expected settings field."""
+        assert field_name in _APP_FIELDS
 
     def test_app_settings_loads_from_environment(
         self, monkeypatch: pytest.MonkeyPatch
@@ -77,9 +82,8 @@ class TestAppSettingsBasicFields:
         """AppSettings should load values from environment variables."""
         monkeypatch.setenv("DATA_GO_KR_API_KEY", "test-api-key-123")
 
-        from real_estate.config_validator import AppSettings
-
-        settings = AppSettings()
+        # _env_file=None keeps the test about env vars, not .env discovery
+        settings = AppSettings(_env_file=None)
         assert settings.data_go_kr_api_key == "test-api-key-123"
 
     def test_app_settings_loads_from_dotenv_file(
@@ -93,8 +97,6 @@ class TestAppSettingsBasicFields:
         # Clear any existing environment variable to test .env file loading
         monkeypatch.delenv("DATA_GO_KR_API_KEY", raising=False)
 
-        from real_estate.config_validator import AppSettings
-
         # Pass explicit env_file path to ensure the temp .env is loaded
         settings = AppSettings(_env_file=str(env_file))
         assert settings.data_go_kr_api_key == "dotenv-key-456"
@@ -113,57 +115,26 @@ class TestRequiredFieldValidation:
     ) -> None:
         """Missing DATA_GO_KR_API_KEY should raise ValidationError."""
 
-        from real_estate.config_validator import AppSettings
-
         monkeypatch.delenv("DATA_GO_KR_API_KEY", raising=False)
 
         # Use _env_file=None to prevent loading from .env file
         with pytest.raises(ValidationError):
             AppSettings(_env_file=None)
 
-    def test_empty_data_go_kr_api_key_raises_validation_error(
-        self, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
+    def test_empty_data_go_kr_api_key_raises_validation_error(self) -> None:
         """Empty DATA_GO_KR_API_KEY should raise ValidationError."""
-
-        from real_estate.config_validator import AppSettings
-
-        monkeypatch.setenv("DATA_GO_KR_API_KEY", "")
-
         with pytest.raises(ValidationError):
-            AppSettings(_env_file=None)
-
-    def test_validation_error_includes_variable_name(
-        self, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
-        """ValidationError message should include the field name."""
-
-        from real_estate.config_validator import AppSettings
-
-        monkeypatch.delenv("DATA_GO_KR_API_KEY", raising=False)
+            AppSettings(_env_file=None, data_go_kr_api_key="")
 
+    def test_validation_error_message_is_actionable(self) -> None:
+        """ValidationError should name the field and include setup instructions."""
+        # Empty string triggers the custom validator
         with pytest.raises(ValidationError) as exc_info:
-            AppSettings(_env_file=None)
+            AppSettings(_env_file=None, data_go_kr_api_key="")
 
         error_message = str(exc_info.value)
-        # Pydantic uses lowercase field name in error message
+        # Pydantic uses the lowercase field name; our validator adds the setup URL
         assert "data_go_kr_api_key" in error_message.lower()
-
-    def test_validation_error_includes_setup_instructions(
-        self, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
-        """ValidationError message should include setup instructions when key is empty."""
-
-        from real_estate.config_validator import AppSettings
-
-        # Set empty string to trigger custom validator
-        monkeypatch.setenv("DATA_GO_KR_API_KEY", "")
-
-        with pytest.raises(ValidationError) as exc_info:
-            AppSettings(_env_file=None)
-
-        error_message = str(exc_info.value)
-        # Our custom validator includes setup instructions
         assert "https://apis.data.go.kr" in error_message
 
 
@@ -176,108 +147,61 @@ class TestOptionalFieldsWithFallback:
     """Tests for optional fields with fallback logic."""
 
     def test_onbid_api_key_defaults_to_none(
-        self, monkeypatch: pytest.MonkeyPatch
+        self, make_settings, monkeypatch: pytest.MonkeyPatch
     ) -> None:
         """ONBID_API_KEY should default to None if not set."""
-        from real_estate.config_validator import AppSettings
-
-        monkeypatch.setenv("DATA_GO_KR_API_KEY", "test-key")
         monkeypatch.delenv("ONBID_API_KEY", raising=False)
 
-        settings = AppSettings()
+        settings = make_settings(data_go_kr_api_key="test-key")
         assert settings.onbid_api_key is None
 
-    def test_get_onbid_key_returns_onbid_key_when_set(
-        self, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
+    def test_get_onbid_key_returns_onbid_key_when_set(self, make_settings) -> None:
         """get_onbid_key() should return ONBID_API_KEY when set."""
-        from real_estate.config_validator import AppSettings
-
-        monkeypatch.setenv("DATA_GO_KR_API_KEY", "data-key")
-        monkeypatch.setenv("ONBID_API_KEY", "onbid-key")
-
-        settings = AppSettings()
+        settings = make_settings(data_go_kr_api_key="data-key", onbid_api_key="onbid-key")
         assert settings.get_onbid_key() == "onbid-key"
 
-    def test_get_onbid_key_falls_back_to_data_go_kr_key(
-        self, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
+    def test_get_onbid_key_falls_back_to_data_go_kr_key(self, make_settings) -> None:
         """get_onbid_key() should fall back to DATA_GO_KR_API_KEY when ONBID_API_KEY is not set."""
-        from real_estate.config_validator import AppSettings
-
-        monkeypatch.setenv("DATA_GO_KR_API_KEY", "data-key")
-        monkeypatch.delenv("ONBID_API_KEY", raising=False)
-
-        settings = AppSettings()
+        settings = make_settings(data_go_kr_api_key="data-key", onbid_api_key=None)
         assert settings.get_onbid_key() == "data-key"
 
-    def test_get_odcloud_auth_returns_api_key_mode_when_set(
-        self, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
-        """get_odcloud_auth() should return ('authorization', ODCLOUD_API_KEY) when set."""
-        from real_estate.config_validator import AppSettings
-
-        monkeypatch.setenv("DATA_GO_KR_API_KEY", "data-key")
-        monkeypatch.setenv("ODCLOUD_API_KEY", "odcloud-api-key")
-        monkeypatch.delenv("ODCLOUD_SERVICE_KEY", raising=False)
-
-        settings = AppSettings()
-        mode, key = settings.get_odcloud_auth()
-        assert mode == "authorization"
-        assert key == "odcloud-api-key"
-
-    def test_get_odcloud_auth_falls_back_to_service_key(
-        self, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
-        """get_odcloud_auth() should fall back to ('serviceKey', ODCLOUD_SERVICE_KEY)."""
-        from real_estate.config_validator import AppSettings
-
-        monkeypatch.setenv("DATA_GO_KR_API_KEY", "data-key")
-        monkeypatch.delenv("ODCLOUD_API_KEY", raising=False)
-        monkeypatch.setenv("ODCLOUD_SERVICE_KEY", "service-key")
-
-        settings = AppSettings()
-        mode, key = settings.get_odcloud_auth()
-        assert mode == "serviceKey"
-        assert key == "service-key"
-
-    def test_get_odcloud_auth_falls_back_to_data_go_kr_key(
-        self, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
-        """get_odcloud_auth() should fall back to DATA_GO_KR_API_KEY when no ODCLOUD key."""
-        from real_estate.config_validator import AppSettings
-
-        monkeypatch.setenv("DATA_GO_KR_API_KEY", "data-key")
-        monkeypatch.delenv("ODCLOUD_API_KEY", raising=False)
-        monkeypatch.delenv("ODCLOUD_SERVICE_KEY", raising=False)
-
-        settings = AppSettings()
-        mode, key = settings.get_odcloud_auth()
-        assert mode == "serviceKey"
-        assert key == "data-key"
-
+    @pytest.mark.parametrize(
+        ("odcloud_api_key", "odcloud_service_key", "expected"),
+        [
+            pytest.param(
+                "odcloud-api-key",
+                "service-key",
+                ("authorization", "odcloud-api-key"),
+                id="api_key_wins",
+            ),
+            pytest.param(
+                None,
+                "service-key",
+                ("serviceKey", "service-key"),
+                id="service_key_fallback",
+            ),
+            pytest.param(
+                None,
+                None,
+                ("serviceKey", "data-key"),
+                id="data_go_kr_fallback",
+            ),
+        ],
+    )
     def test_get_odcloud_auth_priority_order(
-        self, monkeypatch: pytest.MonkeyPatch
+        self,
+        make_settings,
+        odcloud_api_key: str | None,
+        odcloud_service_key: str | None,
+        expected: tuple[str, str],
     ) -> None:
         """get_odcloud_auth() should prioritize ODCLOUD_API_KEY > SERVICE_KEY > DATA_GO_KR."""
-        from real_estate.config_validator import AppSettings
-
-        # All keys set - should prefer ODCLOUD_API_KEY
-        monkeypatch.setenv("DATA_GO_KR_API_KEY", "data-key")
-        monkeypatch.setenv("ODCLOUD_API_KEY", "api-key")
-        monkeypatch.setenv("ODCLOUD_SERVICE_KEY", "service-key")
-
-        settings = AppSettings()
-        mode, key = settings.get_odcloud_auth()
-        assert mode == "authorization"
-        assert key == "api-key"
-
-        # ODCLOUD_API_KEY not set - should use ODCLOUD_SERVICE_KEY
-        monkeypatch.delenv("ODCLOUD_API_KEY", raising=False)
-        settings2 = AppSettings()
-        mode2, key2 = settings2.get_odcloud_auth()
-        assert mode2 == "serviceKey"
-        assert key2 == "service-key"
+        settings = make_settings(
+            data_go_kr_api_key="data-key",
+            odcloud_api_key=odcloud_api_key,
+            odcloud_service_key=odcloud_service_key,
+        )
+        assert settings.get_odcloud_auth() == expected
 
 
 # ---------------------------------------------------------------------------
@@ -292,26 +216,22 @@ class TestGetSettingsHelper:
         self, monkeypatch: pytest.MonkeyPatch
     ) -> None:
         """get_settings() should return an AppSettings instance."""
-        import real_estate.config_validator as config_module
-
-        # Reset the global settings
-        config_module._settings = None
+        # Reset the cached settings
+        config_module.get_settings.cache_clear()
         monkeypatch.setenv("DATA_GO_KR_API_KEY", "test-key")
 
         settings = config_module.get_settings()
         assert isinstance(settings, config_module.AppSettings)
 
         # Cleanup
-        config_module._settings = None
+        config_module.get_settings.cache_clear()
 
     def test_get_settings_returns_singleton(
         self, monkeypatch: pytest.MonkeyPatch
     ) -> None:
         """get_settings() should return the same instance on multiple calls."""
-        import real_estate.config_validator as config_module
-
-        # Reset the global settings
-        config_module._settings = None
+        # Reset the cached settings
+        config_module.get_settings.cache_clear()
         monkeypatch.setenv("DATA_GO_KR_API_KEY", "test-key")
 
         settings1 = config_module.get_settings()
@@ -319,4 +239,4 @@ class TestGetSettingsHelper:
         assert settings1 is settings2
 
         # Cleanup
-        config_module._settings = None
+        config_module.get_settings.cache_clear()